@@ -1,8 +1,10 @@
-from fastapi import Depends, HTTPException, status
+from aiogoogle.auth.creds import UserCreds
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jwt import decode as jwt_decode, PyJWTError
 
 from app.env_validator import get_settings
+from app.google.services import GoogleRequestService
 from app.user.entities import User
 
 from app.application.typevar import USER_ID
@@ -12,6 +14,13 @@ settings = get_settings()
 security = HTTPBearer(scheme_name="Access Token")
 
 
+async def user_by_email_cache(request: Request) -> dict:
+    cache = getattr(request.state, "user_by_email", None)
+    if cache is None:
+        cache = request.state.user_by_email = {}
+    return cache
+
+
 async def get_current_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> USER_ID:
@@ -94,3 +103,15 @@ async def get_current_auth_user_entity(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token",
         )
+
+
+async def get_google_credential(
+    request: Request,
+    user: User = Depends(get_current_auth_user_entity),
+) -> UserCreds:
+    credential = getattr(request.state, "google_credential", None)
+    if credential is None:
+        credential = request.state.google_credential = (
+            GoogleRequestService.build_user_credentials(user.google_credential)
+        )
+    return credential
@@ -0,0 +1,39 @@
+from functools import wraps
+from weakref import WeakKeyDictionary
+
+from fastapi.dependencies import utils as dependency_utils
+
+_PATCHED_FUNCTIONS = (
+    "is_coroutine_callable",
+    "is_async_gen_callable",
+    "is_gen_callable",
+)
+
+
+def _cache_by_callable(func):
+    cache: WeakKeyDictionary = WeakKeyDictionary()
+
+    @wraps(func)
+    def wrapper(call):
+        try:
+            return cache[call]
+        except KeyError:
+            result = cache[call] = func(call)
+            return result
+        except TypeError:
+            # weakref 를 지원하지 않는 callable 은 캐시하지 않음
+            return func(call)
+
+    wrapper.__dependency_cache__ = True
+    return wrapper
+
+
+def patch_dependency_inspection() -> None:
+    """
+    FastAPI 가 요청마다 dependency 의 종류(coroutine / generator)를 inspect 로 다시
+    판별하지 않도록 callable 별로 결과를 캐시
+    """
+    for name in _PATCHED_FUNCTIONS:
+        func = getattr(dependency_utils, name)
+        if not getattr(func, "__dependency_cache__", False):
+            setattr(dependency_utils, name, _cache_by_callable(func))
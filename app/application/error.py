@@ -1,16 +1,25 @@
-from enum import Enum
+from typing import Final
 
 
-class ErrorCode(str, Enum):
-    INTERNAL_SERVER_ERROR = "INTERNAL_SERVER_ERROR"
-    ACCESS_DENIED = "ACCESS_DENIED"
+class ErrorCode:
+    INTERNAL_SERVER_ERROR: Final = "INTERNAL_SERVER_ERROR"
+    ACCESS_DENIED: Final = "ACCESS_DENIED"
 
-    INVALID_GOOGLE_CODE = "INVALID_GOOGLE_CODE"
-    INVALID_SERVER_STATE = "INVALID_SERVER_STATE"
+    INVALID_GOOGLE_CODE: Final = "INVALID_GOOGLE_CODE"
+    INVALID_SERVER_STATE: Final = "INVALID_SERVER_STATE"
 
-    INVALID_ACCESS_TOKEN = "INVALID_ACCESS_TOKEN"
-    ALREADY_VERIFIED = "ALREADY_VERIFIED"
-    INVALID_VERIFICATION_CODE = "INVALID_VERIFICATION_CODE"
+    INVALID_ACCESS_TOKEN: Final = "INVALID_ACCESS_TOKEN"
+    ALREADY_VERIFIED: Final = "ALREADY_VERIFIED"
+    INVALID_VERIFICATION_CODE: Final = "INVALID_VERIFICATION_CODE"
 
-    INVALID_SPREADSHEET_ID = "INVALID_SPREADSHEET_ID"
-    INVALID_MATCH_ID = "INVALID_MATCH_ID"
+    INVALID_SPREADSHEET_ID: Final = "INVALID_SPREADSHEET_ID"
+    INVALID_MATCH_ID: Final = "INVALID_MATCH_ID"
+
+    SPREADSHEET_NOT_FOUND: Final = "SPREADSHEET_NOT_FOUND"
+    SHEET_NOT_FOUND: Final = "SHEET_NOT_FOUND"
+    STUDENT_NOT_FOUND: Final = "STUDENT_NOT_FOUND"
+
+
+VALID_ERROR_CODES: Final[frozenset[str]] = frozenset(
+    value for key, value in vars(ErrorCode).items() if not key.startswith("_")
+)
@@ -5,7 +5,11 @@ from pydantic import ConfigDict, BaseModel
 from pydantic.alias_generators import to_camel
 
 common_config = ConfigDict(
-    alias_generator=to_camel, populate_by_name=True, json_encoders={UUID: str}
+    alias_generator=to_camel,
+    populate_by_name=True,
+    json_encoders={UUID: str},
+    extra="ignore",
+    validate_assignment=False,
 )
 
 
@@ -3,7 +3,6 @@ from typing import Generic, TypeVar, Any
 from fastapi import HTTPException
 from pydantic import Field, BaseModel
 
-from app.application.error import ErrorCode
 from app.application.pydantic_model import BaseSchema
 
 T = TypeVar("T")
@@ -19,7 +18,7 @@ class SuccessfulEntityResponse(BaseSchema):
 
 
 class ErrorResponse(BaseSchema):
-    error_code: ErrorCode = Field(..., examples=["USER_NOT_FOUND"])
+    error_code: str = Field(..., examples=["USER_NOT_FOUND"])
     message: str = Field(..., examples=["요청한 사용자를 찾을 수 없습니다."])
     error_data: dict[str, Any] | None = Field(
         {},
@@ -33,7 +32,7 @@ class APIError(HTTPException):
     def __init__(
         self,
         status_code: int,
-        error_code: ErrorCode,
+        error_code: str,
         message: str,
         error_data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
@@ -41,7 +40,7 @@ class APIError(HTTPException):
         if error_data is None:
             error_data = {}
         self.error_response = ErrorResponse(
-            error_code=error_code.value, message=message, error_data=error_data
+            error_code=error_code, message=message, error_data=error_data
         )
 
         super().__init__(
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 from fastapi_restful.cbv import cbv
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
+from app.application.ratelimit import limiter
 from app.application.response import APIResponse
 
 router = APIRouter(
@@ -10,18 +10,14 @@ router = APIRouter(
     tags=["TestEndpoint"],
     responses={404: {"description": "Not found"}},
 )
-limiter = Limiter(key_func=get_remote_address)
 
 
 @cbv(router)
 class TestEndpoint:
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-    @router.get("/google-callback")
+    @router.get("/google-callback", response_model=APIResponse[dict])
     async def google_callback(
         self, state: str = Query(), code: str = Query()
-    ) -> APIResponse[dict]:
-        return APIResponse(
-            message="Google Callback", data={"state": state, "code": code}
+    ) -> ORJSONResponse:
+        return ORJSONResponse(
+            {"message": "Google Callback", "data": {"state": state, "code": code}}
         )
@@ -1,5 +1,8 @@
-import re
-
-
 def validate_email(email: str) -> bool:
-    return bool(re.search(r"\d+sunrin\d+", email))
+    # r"\d+sunrin\d+" 검색과 동일: 앞뒤가 숫자인 "sunrin" 이 있는지 확인
+    start = email.find("sunrin", 1)
+    while start != -1:
+        if email[start - 1].isdecimal() and email[start + 6 : start + 7].isdecimal():
+            return True
+        start = email.find("sunrin", start + 1)
+    return False
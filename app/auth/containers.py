@@ -9,4 +9,4 @@ if TYPE_CHECKING:
 
 class AuthContainer(containers.DeclarativeContainer):
     google_service: "GoogleRequestService" = providers.Dependency()
-    service: "AuthService" = providers.Factory(AuthService)
+    service: "AuthService" = providers.Singleton(AuthService)
@@ -1,7 +1,9 @@
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from app.application.pydantic_model import BaseSchema
 
 
 class AuthVerifyDTO(BaseSchema):
+    model_config = ConfigDict(frozen=True)
+
     code: str = Field(..., description="구글 로그인 후 받은 code 값")
@@ -1,21 +1,21 @@
-import aiogoogle.excs
-import traceback
+import asyncio
+import logging
 
-from dependency_injector.wiring import inject, Provide
+import aiogoogle.excs
 
 from fastapi import APIRouter, Depends
 from fastapi_restful.cbv import cbv
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
+from app.application.authorization import user_by_email_cache
 from app.application.error import ErrorCode
+from app.application.ratelimit import limiter
 from app.application.response import APIResponse, APIError
 from app.application.utils import validate_email
 from app.auth.dto.auth import AuthVerifyDTO
 from app.auth.schema.string import AuthorizationURLSchema
 from app.auth.schema.user import UserLoginResponse, UserLoginRequestType
 from app.auth.services import AuthService
-from app.containers import AppContainers
+from app.containers import get_auth_service, get_google_service
 from app.google.services import GoogleRequestService
 
 from app.user.entities import User
@@ -29,24 +29,17 @@ router = APIRouter(
     tags=["Authorization"],
     responses={404: {"description": "Not found"}},
 )
-limiter = Limiter(key_func=get_remote_address)
 
 
 @cbv(router)
 class AuthEndpoint:
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
     @router.get(
         "/authorization-url",
         description="구글 로그인 URL을 반환합니다.",
     )
-    @inject
     async def get_authorization_url(
         self,
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        google_service: GoogleRequestService = Depends(get_google_service),
     ) -> APIResponse[AuthorizationURLSchema]:
         authorization_url = await google_service.get_authorization_url()
         return APIResponse(
@@ -58,14 +51,12 @@ class AuthEndpoint:
         "/login",
         description="구글 로그인 후 사용자 정보를 반환합니다. (안되어있으면 자동가입)",
     )
-    @inject
     async def login(
         self,
         data: AuthVerifyDTO,
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
-        auth_service: AuthService = Depends(Provide[AppContainers.auth.service]),
+        google_service: GoogleRequestService = Depends(get_google_service),
+        auth_service: AuthService = Depends(get_auth_service),
+        user_cache: dict = Depends(user_by_email_cache),
     ) -> APIResponse[UserLoginResponse]:
         try:
             user_credential_data = await google_service.fetch_user_credentials(
@@ -73,7 +64,9 @@ class AuthEndpoint:
             )
         except aiogoogle.excs.HTTPError:
             logger.error(
-                f"Invalid google code: {data.code}, {traceback.format_exc()}",
+                "Invalid google code: %s",
+                data.code,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
             )
             raise APIError(
                 status_code=400,
@@ -81,35 +74,56 @@ class AuthEndpoint:
                 message="구글 코드가 유효하지 않습니다.",
             )
         user_info = await google_service.fetch_user_info(user_credential_data)
-        odm_user = await User.find({"email": user_info["email"]}).first_or_none()
+        odm_user = await auth_service.find_login_user(user_info["email"], user_cache)
         # if validate_email(user_info["email"]):
         #     raise APIError(
         #         status_code=403,
         #         error_code=ErrorCode.ACCESS_DENIED,
         #         message="이 리소스에 접근할 권한이 없습니다.",
         #     )
+        # 재동의 시 구글이 refresh token 을 생략할 수 있으므로 기존 값으로 대체하고,
+        # 둘 다 없으면 model_construct 로 검증 없이 저장하기 전에 거절
+        refresh_token = user_credential_data.get("refresh_token") or (
+            odm_user.refresh_token_fallback if odm_user else None
+        )
+        if not refresh_token:
+            raise APIError(
+                status_code=400,
+                error_code=ErrorCode.INVALID_GOOGLE_CODE,
+                message="구글 refresh token 을 받지 못했습니다. 다시 로그인해주세요.",
+            )
         if not odm_user:
             odm_user = User(
                 email=user_info["email"],
                 name=user_info["name"],
                 picture=user_info["picture"],
-                google_credential=GoogleCredential(
+                google_credential=GoogleCredential.model_construct(
                     access_token=user_credential_data.get("access_token"),
-                    refresh_token=user_credential_data.get("refresh_token"),
+                    refresh_token=refresh_token,
                     access_token_expires_at=user_credential_data.get("expires_at"),
                 ),
             )
-            await odm_user.create()
-            access_token = await auth_service.create_access_token(str(odm_user.id))
             user_credential = google_service.build_user_credentials(
                 odm_user.google_credential
             )
-            response = await google_service.fetch_drive_folder_id_by_name(
-                "Mixir-팀빌딩", credential=user_credential
-            )
-            if len(response["files"]) == 0:
-                await google_service.create_drive_folder(
-                    "Mixir-팀빌딩", credential=user_credential
+            await odm_user.create()
+            try:
+                _, access_token = await asyncio.gather(
+                    google_service.create_drive_folder(
+                        "Mixir-팀빌딩", credential=user_credential, if_not_exists=True
+                    ),
+                    auth_service.create_access_token(str(odm_user.id)),
+                )
+            except aiogoogle.excs.HTTPError:
+                logger.error(
+                    "Signup drive setup failed: user.id=%s",
+                    odm_user.id,
+                    exc_info=logger.isEnabledFor(logging.DEBUG),
+                )
+                raise APIError(
+                    status_code=500,
+                    error_code=ErrorCode.INTERNAL_SERVER_ERROR,
+                    message="구글 드라이브 폴더를 준비하지 못했습니다.",
                 )
 
             return APIResponse(
@@ -119,15 +133,33 @@ class AuthEndpoint:
                 ),
             )
         else:
-            new_google_credential = GoogleCredential(
-                access_token=user_credential_data.get("access_token"),
-                refresh_token=user_credential_data.get(
-                    "refresh_token", odm_user.google_credential.refresh_token
+            # GoogleCredential 은 camelCase alias 로 저장됨 (refreshCount 는 유지)
+            result, access_token = await asyncio.gather(
+                User.get_motor_collection().update_one(
+                    {"_id": odm_user.id},
+                    {
+                        "$set": {
+                            "google_credential.accessToken": user_credential_data.get(
+                                "access_token"
+                            ),
+                            "google_credential.refreshToken": refresh_token,
+                            "google_credential.accessTokenExpiresAt": user_credential_data.get(
+                                "expires_at"
+                            ),
+                        }
+                    },
                 ),
-                access_token_expires_at=user_credential_data.get("expires_at"),
+                auth_service.create_access_token(str(odm_user.id)),
             )
-            await odm_user.set({User.google_credential: new_google_credential})
-            access_token = await auth_service.create_access_token(str(odm_user.id))
+            # 캐시된 projection 은 다른 요청과 공유되므로 수정하지 않고 캐시에서 제거
+            auth_service.forget_login_user(user_info["email"])
+            if result.matched_count == 0:
+                # 캐시된 뒤 삭제된 유저에게는 토큰을 발급하지 않음
+                raise APIError(
+                    status_code=401,
+                    error_code=ErrorCode.ACCESS_DENIED,
+                    message="사용자 정보를 찾을 수 없습니다. 다시 로그인해주세요.",
+                )
             return APIResponse(
                 message="로그인 완료.",
                 data=UserLoginResponse(
@@ -1,7 +1,9 @@
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from app.application.pydantic_model import BaseSchema
 
 
 class AuthorizationURLSchema(BaseSchema):
+    model_config = ConfigDict(frozen=True)
+
     url: str = Field(..., description="구글 로그인 URL")
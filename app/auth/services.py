@@ -1,3 +1,6 @@
+from hashlib import sha256
+
+from cachetools import TTLCache
 from jwt import encode as jwt_encode, decode as jwt_decode, PyJWTError
 from passlib.context import CryptContext
 
@@ -8,11 +11,17 @@ from app.logger import use_logger
 
 from app.auth.entities import VerificationCode
 from app.user.entities import User
+from app.user.entities.user import UserLoginView
 from app.application.typevar import USER_ID
 
 logger = use_logger("auth_service")
 settings = get_settings()
 
+# 같은 유저에 대한 연속 로그인 시 bcrypt nonce 및 JWT 서명을 재사용
+_access_token_cache: TTLCache[str, str] = TTLCache(maxsize=10_000, ttl=30)
+# 로그인 시 이메일 -> User projection 조회 결과 (존재하는 유저만 저장)
+_login_user_cache: TTLCache[str, UserLoginView] = TTLCache(maxsize=10_000, ttl=30)
+
 
 async def get_phone_by_token(token: str) -> str:
     payload = jwt_decode(token, settings.JWT_SECRET_KEY, algorithms=["HS256"])
@@ -57,6 +66,29 @@ class AuthService:
             return False
         return entity
 
+    @staticmethod
+    async def find_login_user(
+        email: str, request_cache: dict[str, UserLoginView] | None = None
+    ) -> UserLoginView | None:
+        if request_cache is not None and email in request_cache:
+            return request_cache[email]
+        entity = _login_user_cache.get(email)
+        if entity is None:
+            entity = await User.find_one(
+                {"email": email}, projection_model=UserLoginView
+            )
+            if entity is None:
+                return None
+            _login_user_cache[email] = entity
+        if request_cache is not None:
+            request_cache[email] = entity
+        return entity
+
+    @staticmethod
+    def forget_login_user(email: str) -> None:
+        # 유저 정보가 바뀐 뒤에는 다음 로그인에서 DB 를 다시 조회
+        _login_user_cache.pop(email, None)
+
     def create_nonce(self, entity_id: str, salt: str) -> str:
         nonce_content = (
             salt[0] + "73" + entity_id[:6] + salt[2:4] + "2" + entity_id[7:10]
@@ -70,12 +102,21 @@ class AuthService:
         return self.hashed_context.verify(nonce_content, nonce)
 
     async def create_access_token(self, entity_id: str) -> str:
+        # 시크릿 키가 바뀌면 캐시 키도 달라지도록 키 해시를 prefix로 사용
+        cache_key = (
+            sha256(settings.JWT_SECRET_KEY.encode()).hexdigest()[:8] + ":" + entity_id
+        )
+        cached_jwt = _access_token_cache.get(cache_key)
+        if cached_jwt is not None:
+            return cached_jwt
+
         hash_nonce = self.create_nonce(entity_id, settings.JWT_SECRET_KEY[2:8])
         encoded_jwt = jwt_encode(
             {"uid": entity_id, "hn": hash_nonce},
             settings.JWT_SECRET_KEY,
             algorithm="HS256",
         )
+        _access_token_cache[cache_key] = encoded_jwt
         return encoded_jwt
 
     async def get_user_id_from_token(self, token: str) -> USER_ID:
@@ -1,16 +1,17 @@
 import aiogoogle.excs
+from aiogoogle.auth.creds import UserCreds
 from beanie import WriteRules
 from dependency_injector.wiring import inject, Provide
 
 from fastapi import APIRouter, Depends
 from fastapi_restful.cbv import cbv
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.application.authorization import (
     get_current_auth_user_entity,
+    get_google_credential,
 )
 from app.application.error import ErrorCode
+from app.application.ratelimit import limiter
 from app.application.response import APIResponse, APIError
 from app.bracket.dto.match import MatchTypeDTO
 from app.bracket.schema.match import (
@@ -20,7 +21,7 @@ from app.bracket.schema.match import (
 )
 from app.bracket.services import BracketService
 from app.containers import AppContainers
-from app.google.services import GoogleRequestService
+from app.google.batcher import GoogleRequestBatcher
 from app.student.schema.group import StudentSchema
 
 from app.user.entities import User
@@ -31,14 +32,10 @@ router = APIRouter(
     tags=["Bracket"],
     responses={404: {"description": "Not found"}},
 )
-limiter = Limiter(key_func=get_remote_address)
 
 
 @cbv(router)
 class BracketEndpoint:
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
     @router.get("/list", description="사용자가 생성한 대진표 목록을 조회합니다.")
     @inject
     async def fetch_match_list(
@@ -79,18 +76,16 @@ class BracketEndpoint:
         group_name: str,
         data: MatchTypeDTO,
         user: User = Depends(get_current_auth_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
+        google_credential: UserCreds = Depends(get_google_credential),
+        google_batcher: GoogleRequestBatcher = Depends(
+            Provide[AppContainers.google.batcher]
         ),
         bracket_service: BracketService = Depends(
             Provide[AppContainers.bracket.service]
         ),
     ) -> APIResponse[BracketMatchListSchema]:
-        google_credential = google_service.build_user_credentials(
-            user.google_credential
-        )
         try:
-            spreadsheet_data = await google_service.fetch_spreadsheet_data(
+            spreadsheet_data = await google_batcher.fetch_spreadsheet_data(
                 sheet_id, group_name, credential=google_credential
             )
             student_list = []
@@ -1,11 +1,29 @@
 from dependency_injector import containers, providers
 
 from app.auth.containers import AuthContainer
+from app.auth.services import AuthService
 from app.bracket.containers import BracketContainer
 from app.google.containers import GoogleContainer
+from app.google.batcher import GoogleRequestBatcher
+from app.google.services import GoogleRequestService
 
 
 class AppContainers(containers.DeclarativeContainer):
     google: "GoogleContainer" = providers.Container(GoogleContainer)
     auth: "AuthContainer" = providers.Container(AuthContainer, google_service=google)
     bracket: "BracketContainer" = providers.Container(BracketContainer)
+
+
+container = AppContainers()
+
+
+def get_google_service() -> GoogleRequestService:
+    return container.google.service()
+
+
+def get_google_batcher() -> GoogleRequestBatcher:
+    return container.google.batcher()
+
+
+def get_auth_service() -> AuthService:
+    return container.auth.service()
@@ -6,7 +6,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", frozen=True, extra="ignore"
+    )
 
     APP_ENV: Literal["development", "production", "testing"]
     JWT_SECRET_KEY: str
@@ -20,9 +22,9 @@ class Settings(BaseSettings):
 
     SHEET_TEMPLATE_ID: str
 
-    @staticmethod
     @field_validator("SERVER_PORT")
-    def check_port_range(value: int):
+    @classmethod
+    def check_port_range(cls, value: int) -> int:
         if not 0 < value < 65536:
             raise ValueError("SERVER_PORT number must be between 1 and 65535")
         return value
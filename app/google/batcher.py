@@ -0,0 +1,174 @@
+import asyncio
+from contextlib import suppress
+
+from aiogoogle.auth.creds import UserCreds
+
+from app.google.services import GoogleRequestService
+from app.logger import use_logger
+
+logger = use_logger("google_batcher")
+
+
+def _closed_error() -> RuntimeError:
+    return RuntimeError("Google request batcher is closed")
+
+
+def _fail_pending(futures, error: BaseException) -> None:
+    for future in futures:
+        if not future.done():
+            future.set_exception(error)
+
+
+class GoogleRequestBatcher:
+    """
+    같은 스프레드시트에 대한 동시 시트 조회를 모아서 values.batchGet 한 번으로 처리
+
+    요청은 큐에 쌓이고, flush 루프가 flush_interval_ms 마다 (또는 max_batch 개가 모이면)
+    (스프레드시트, 유저) 단위로 묶어서 fetch_spreadsheet_data_multi 를 호출함
+    """
+
+    def __init__(
+        self,
+        google_service: GoogleRequestService,
+        flush_interval_ms: int = 20,
+        max_batch: int = 50,
+        result_timeout: float = 90,
+    ) -> None:
+        self._google_service = google_service
+        self._flush_interval = flush_interval_ms / 1000
+        self._max_batch = max_batch
+        self._result_timeout = result_timeout
+        self._runner: asyncio.Task | None = None
+        self._queue: asyncio.Queue[
+            tuple[str, str, UserCreds, asyncio.Future]
+        ] = asyncio.Queue()
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def fetch_spreadsheet_data(
+        self, sheet_id: str, tab_name: str, credential: UserCreds
+    ) -> dict:
+        if self._runner is None or self._runner.done():
+            # flush 루프가 없으면 (lifespan 밖에서 사용 등) 묶지 않고 바로 조회
+            return await self._google_service.fetch_spreadsheet_data(
+                sheet_id, tab_name, credential
+            )
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((sheet_id, tab_name, credential, future))
+        return await asyncio.wait_for(future, self._result_timeout)
+
+    def start(self) -> asyncio.Task:
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self.run())
+        return self._runner
+
+    async def aclose(self) -> None:
+        if self._runner is not None:
+            self._runner.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._runner
+            self._runner = None
+        for task in list(self._flush_tasks):
+            task.cancel()
+        await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        # 종료 시 큐에 남은 요청이 응답을 기다리며 멈추지 않도록 실패 처리
+        while not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            _fail_pending([future], _closed_error())
+
+    async def _collect(self) -> list[tuple[str, str, UserCreds, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
+        try:
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            _fail_pending((future for *_, future in batch), _closed_error())
+            raise
+        return batch
+
+    async def _flush_group(
+        self,
+        sheet_id: str,
+        credential: UserCreds,
+        items: list[tuple[str, asyncio.Future]],
+    ) -> None:
+        try:
+            await self._fetch_group(sheet_id, credential, items)
+        except asyncio.CancelledError:
+            # 종료 중 취소된 경우에도 기다리는 요청이 멈추지 않도록 실패 처리
+            _fail_pending((future for _, future in items), _closed_error())
+            raise
+        except Exception as e:
+            logger.exception("Failed to fetch batched sheet reads")
+            _fail_pending((future for _, future in items), e)
+
+    async def _fetch_group(
+        self,
+        sheet_id: str,
+        credential: UserCreds,
+        items: list[tuple[str, asyncio.Future]],
+    ) -> None:
+        tab_names = list(dict.fromkeys(tab_name for tab_name, _ in items))
+        try:
+            response = await self._google_service.fetch_spreadsheet_data_multi(
+                sheet_id, tab_names, credential
+            )
+        except Exception as e:
+            if len(tab_names) == 1:
+                _fail_pending((future for _, future in items), e)
+                return
+            # 한 시트의 오류(없는 시트 이름 등)가 같이 묶인 다른 요청까지 실패시키지
+            # 않도록 시트별로 다시 조회
+            logger.debug("batchGet failed, falling back to per-tab reads: %s", e)
+            results = await asyncio.gather(
+                *(
+                    self._google_service.fetch_spreadsheet_data(
+                        sheet_id, tab_name, credential
+                    )
+                    for tab_name in tab_names
+                ),
+                return_exceptions=True,
+            )
+            response = dict(zip(tab_names, results))
+        for tab_name, future in items:
+            if future.done():
+                continue
+            result = response.get(tab_name, {})
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def run(self) -> None:
+        while True:
+            batch = await self._collect()
+            try:
+                self._flush(batch)
+            except Exception as e:
+                # 한 번의 flush 실패로 루프가 멈추면 이후 조회가 모두 응답을 받지 못함
+                logger.exception("Failed to flush sheet reads")
+                _fail_pending((future for *_, future in batch), e)
+
+    def _flush(self, batch: list[tuple[str, str, UserCreds, asyncio.Future]]) -> None:
+        groups: dict[tuple[str, str], list] = {}
+        credentials: dict[tuple[str, str], UserCreds] = {}
+        for sheet_id, tab_name, credential, future in batch:
+            key = (sheet_id, credential["refresh_token"])
+            groups.setdefault(key, []).append((tab_name, future))
+            credentials.setdefault(key, credential)
+        logger.debug(
+            "Flushing %d sheet reads in %d batchGet calls", len(batch), len(groups)
+        )
+        for key, items in groups.items():
+            task = asyncio.create_task(
+                self._flush_group(key[0], credentials[key], items)
+            )
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
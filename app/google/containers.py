@@ -1,7 +1,11 @@
 from dependency_injector import containers, providers
 
+from app.google.batcher import GoogleRequestBatcher
 from app.google.services import GoogleRequestService
 
 
 class GoogleContainer(containers.DeclarativeContainer):
-    service: GoogleRequestService = providers.Factory(GoogleRequestService)
+    service: GoogleRequestService = providers.Singleton(GoogleRequestService)
+    batcher: GoogleRequestBatcher = providers.Singleton(
+        GoogleRequestBatcher, google_service=service
+    )
@@ -0,0 +1,117 @@
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import wraps
+
+from aiogoogle import excs as aiogoogle_excs
+
+# 429 / 5xx 는 구글 쪽 과부하 신호로 보고 동시성을 줄임
+BACKOFF_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# 429 는 요청이 처리되지 않았음이 보장되므로 멱등하지 않은 요청도 재시도 가능
+RATE_LIMIT_STATUS_CODES = frozenset({429})
+
+
+@dataclass
+class GoogleApiLimiter:
+    """
+    Google API 호출용 AIMD 동시성 제어 + 분당 요청 수 제한
+
+    성공 시 동시 요청 수(c_t)를 alpha 만큼 늘리고, 429/5xx 응답 시 beta 배로 줄임
+    Sheets 프로젝트 쿼터(분당 300회)를 넘지 않도록 최근 요청 시각을 기록함
+    """
+
+    c_t: float = 8
+    c_min: float = 1
+    c_max: float = 64
+    alpha: float = 1
+    beta: float = 0.5
+    latency_target: float = 2.0
+    window_limit: int = 300
+    window_seconds: float = 60
+
+    _in_flight: int = field(default=0, init=False)
+    _condition: asyncio.Condition = field(default_factory=asyncio.Condition, init=False)
+    _window: deque[float] = field(default_factory=deque, init=False)
+    _window_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+
+    async def _acquire_window(self) -> None:
+        async with self._window_lock:
+            while True:
+                now = time.monotonic()
+                while self._window and now - self._window[0] >= self.window_seconds:
+                    self._window.popleft()
+                if len(self._window) < self.window_limit:
+                    self._window.append(now)
+                    return
+                await asyncio.sleep(self._window[0] + self.window_seconds - now)
+
+    async def _acquire_slot(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.c_t))
+            self._in_flight += 1
+
+    async def _release_slot(self, overloaded: bool, latency: float) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self.c_t = max(self.c_min, self.c_t * self.beta)
+            elif latency < self.latency_target:
+                self.c_t = min(self.c_max, self.c_t + self.alpha / max(self.c_t, 1))
+            self._condition.notify_all()
+
+    async def call(self, func, *args, **kwargs):
+        await self._acquire_window()
+        await self._acquire_slot()
+        overloaded = False
+        started = time.monotonic()
+        try:
+            return await func(*args, **kwargs)
+        except aiogoogle_excs.HTTPError as e:
+            status_code = getattr(e.res, "status_code", None)
+            overloaded = status_code in BACKOFF_STATUS_CODES
+            raise
+        finally:
+            await self._release_slot(overloaded, time.monotonic() - started)
+
+
+def _retry_after(e: aiogoogle_excs.HTTPError) -> float:
+    headers = getattr(e.res, "headers", None) or {}
+    try:
+        return max(float(headers.get("Retry-After", 0)), 0)
+    except (TypeError, ValueError):
+        # HTTP-date 형식은 무시하고 백오프 시간만 사용
+        return 0
+
+
+def retryable(
+    status: frozenset[int] = BACKOFF_STATUS_CODES,
+    max_retries: int = 5,
+    base: float = 0.5,
+    cap: float = 32,
+):
+    """
+    429/5xx 응답 시 full jitter 지수 백오프로 재시도하는 데코레이터
+
+    Retry-After 헤더가 있으면 그보다 짧게 기다리지 않음
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            attempt = 0
+            while True:
+                try:
+                    return await func(*args, **kwargs)
+                except aiogoogle_excs.HTTPError as e:
+                    status_code = getattr(e.res, "status_code", None)
+                    if status_code not in status or attempt >= max_retries:
+                        raise
+                    backoff = random.uniform(0, min(cap, base * 2**attempt))
+                    await asyncio.sleep(max(backoff, _retry_after(e)))
+                    attempt += 1
+
+        return wrapper
+
+    return decorator
@@ -1,12 +1,28 @@
+import asyncio
 import os
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 
-from aiohttp import ClientSession
+import orjson
+from aiohttp import ClientResponse, ClientTimeout, TCPConnector
+from cachetools import TTLCache
 from app.env_validator import get_settings
 from app.logger import use_logger
 
-from aiogoogle import Aiogoogle, auth as aiogoogle_auth
+from aiogoogle import Aiogoogle, auth as aiogoogle_auth, excs as aiogoogle_excs
 from aiogoogle.auth.creds import UserCreds
+from aiogoogle.resource import GoogleAPI
+from aiogoogle.sessions.aiohttp_session import AiohttpSession
 
+from app.application.error import ErrorCode
+from app.application.response import APIError
+from app.google.limiter import (
+    RATE_LIMIT_STATUS_CODES,
+    GoogleApiLimiter,
+    retryable,
+)
 from app.student.schema.group import StudentSchema
 from app.user.entities.user import GoogleCredential
 from app.utils.string import GoogleScope
@@ -14,38 +30,290 @@ from app.utils.string import GoogleScope
 settings = get_settings()
 logger = use_logger("google_service")
 SERVER_STATE = os.urandom(32).hex()
-logger.debug(f"Google Oauth2 Server state: {SERVER_STATE}")
+logger.debug("Google Oauth2 Server state: %s", SERVER_STATE)
 
 GOOGLE_DRIVE_FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
 GOOGLE_DRIVE_SPREADSHEET_MIME_TYPE = "application/vnd.google-apps.spreadsheet"
+# 학생 시트는 번호, 이름, 성별, 수준 네 열만 사용
+STUDENT_SHEET_COLUMNS = "A:D"
+# 만료까지 이 시간(초) 이상 남은 access token 은 갱신하지 않음
+ACCESS_TOKEN_REFRESH_MARGIN = 300
+
+# Drive 검색 쿼리 템플릿 (name / folder_id 는 _escape_query 로 감싸서 전달)
+_FOLDER_SEARCH_Q = (
+    "name contains {name} and "
+    f"mimeType='{GOOGLE_DRIVE_FOLDER_MIME_TYPE}' and trashed=false"
+)
+_FOLDER_EXACT_Q = (
+    f"name={{name}} and mimeType='{GOOGLE_DRIVE_FOLDER_MIME_TYPE}' and trashed=false"
+)
+_SPREADSHEETS_IN_FOLDER_Q = (
+    f"{{folder_id}} in parents and mimeType='{GOOGLE_DRIVE_SPREADSHEET_MIME_TYPE}'"
+)
+
+_CENTER_MIDDLE_FMT = {"horizontalAlignment": "CENTER", "verticalAlignment": "MIDDLE"}
+_GENDER_KR = {"male": "남", "female": "여"}
+_CELL_FIELDS = (
+    "userEnteredValue,userEnteredFormat(horizontalAlignment,verticalAlignment)"
+)
+
+
+def _cell(value: str | None) -> dict:
+    return {
+        "userEnteredValue": {"stringValue": value},
+        "userEnteredFormat": _CENTER_MIDDLE_FMT,
+    }
+
+
+_GROUP_SHEET_HEADER_ROW = {"values": [_cell(v) for v in ("번호", "이름", "성별", "수준")]}
+
+
+def _escape_query(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def _student_range(tab_name: str) -> str:
+    # A1 표기에서 시트 이름 안의 작은따옴표는 두 번 씀
+    quoted = tab_name.replace("'", "''")
+    return f"'{quoted}'!{STUDENT_SHEET_COLUMNS}"
+
+
+def _orjson_dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
+
+class _ORJSONClientResponse(ClientResponse):
+    # aiogoogle 은 loads 인자 없이 response.json() 을 호출하므로 기본 디코더를 교체
+    async def json(self, *, loads=orjson.loads, **kwargs):
+        return await super().json(loads=loads, **kwargs)
+
+
+@dataclass(frozen=True, slots=True)
+class SpreadsheetMeta:
+    # 시트 제목 -> sheetId (스프레드시트의 시트 순서 유지)
+    sheets_by_title: dict[str, int]
+    raw: dict
+
+    @classmethod
+    def from_response(cls, response: dict) -> "SpreadsheetMeta":
+        return cls(
+            sheets_by_title={
+                sheet["properties"]["title"]: sheet["properties"]["sheetId"]
+                for sheet in response.get("sheets", [])
+            },
+            raw=response,
+        )
+
+
+class SharedAiohttpSession(AiohttpSession):
+    # aiogoogle 은 요청마다 `async with session_factory()` 로 세션을 닫으므로
+    # 같은 세션을 재사용하려면 __aexit__ 에서 닫지 않아야 함 (종료 시 aclose 에서 닫음)
+    async def __aexit__(self, *args, **kwargs) -> None:
+        pass
+
+
+def _expires_in(expires_at: datetime | str | None) -> float:
+    if expires_at is None:
+        return 0
+    if isinstance(expires_at, str):
+        expires_at = datetime.fromisoformat(expires_at)
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return (expires_at - datetime.now(timezone.utc)).total_seconds()
 
 
 class GoogleRequestService:
+    __server_state = SERVER_STATE
+    __google_credentials = aiogoogle_auth.creds.ClientCreds(
+        client_id=settings.GOOGLE_CLIENT_ID,
+        client_secret=settings.GOOGLE_CLIENT_SECRET,
+        scopes=[
+            GoogleScope["userinfo.email"],
+            GoogleScope["userinfo.profile"],
+            GoogleScope["docs"],
+            GoogleScope["drive"],
+            GoogleScope["drive.readonly"],
+            GoogleScope["spreadsheets"],
+        ],
+        redirect_uri=settings.GOOGLE_REDIRECT_URI,
+    )
+
     def __init__(self) -> None:
-        self.__server_state = SERVER_STATE
-
-        self.__google_credentials = aiogoogle_auth.creds.ClientCreds(
-            client_id=settings.GOOGLE_CLIENT_ID,
-            client_secret=settings.GOOGLE_CLIENT_SECRET,
-            scopes=[
-                GoogleScope["userinfo.email"],
-                GoogleScope["userinfo.profile"],
-                GoogleScope["docs"],
-                GoogleScope["drive"],
-                GoogleScope["drive.readonly"],
-                GoogleScope["spreadsheets"],
-            ],
-            redirect_uri=settings.GOOGLE_REDIRECT_URI,
+        self._connector = TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        # 모든 Google API 호출이 하나의 세션(커넥션 풀)을 공유
+        self._session = SharedAiohttpSession(
+            connector=self._connector,
+            connector_owner=False,
+            timeout=ClientTimeout(total=60, connect=10),
+            json_serialize=_orjson_dumps,
+            response_class=_ORJSONClientResponse,
         )
         self._google_client = Aiogoogle(
             client_creds=self.__google_credentials,
+            session_factory=lambda: self._session,
         )
-        self._request = ClientSession()
+        self._limiter = GoogleApiLimiter()
+        # discovery 문서는 프로세스 수명 동안 한 번만 받아옴
+        self._drive_v3: GoogleAPI | None = None
+        self._sheets_v4: GoogleAPI | None = None
+        self._discover_lock = asyncio.Lock()
+        # refresh_token -> 진행 중인 갱신 / 갱신된 자격 증명
+        self._refresh_inflight: dict[str, asyncio.Task] = {}
+        self._refreshed_creds: TTLCache[str, UserCreds] = TTLCache(
+            maxsize=4096, ttl=3600
+        )
+        # spreadsheet_id -> {시트 제목: sheetId}
+        self._sheet_id_cache: TTLCache[str, dict[str, int]] = TTLCache(
+            maxsize=1024, ttl=300
+        )
+        # (refresh_token, 조회 종류, 폴더 이름) -> Drive 목록 조회 결과
+        self._drive_list_cache: TTLCache[tuple[str, str, str], dict | list] = (
+            TTLCache(maxsize=4096, ttl=5)
+        )
+        self._drive_list_inflight: dict[tuple[str, str, str], asyncio.Task] = {}
+        # (refresh_token, 폴더 이름) -> 폴더 ID (루트 폴더는 거의 바뀌지 않음)
+        self._folder_id_cache: TTLCache[tuple[str, str], str] = TTLCache(
+            maxsize=4096, ttl=3600
+        )
+        self._folder_ensure_inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+    async def _drive(self) -> GoogleAPI:
+        if self._drive_v3 is None:
+            async with self._discover_lock:
+                if self._drive_v3 is None:
+                    self._drive_v3 = await self._google_client.discover("drive", "v3")
+        return self._drive_v3
+
+    async def _sheets(self) -> GoogleAPI:
+        if self._sheets_v4 is None:
+            async with self._discover_lock:
+                if self._sheets_v4 is None:
+                    self._sheets_v4 = await self._google_client.discover(
+                        "sheets", "v4"
+                    )
+        return self._sheets_v4
+
+    async def _refresh_credential(self, credential: UserCreds) -> UserCreds:
+        # aiogoogle 은 만료된 토큰만 갱신하므로 expires_at 을 비워서 여유 시간 안에서도
+        # 미리 갱신되도록 함
+        is_refreshed, refreshed = await self._google_client.oauth2.refresh(
+            UserCreds(**{**credential, "expires_at": None}),
+            client_creds=self.__google_credentials,
+        )
+        if is_refreshed:
+            self._refreshed_creds[credential["refresh_token"]] = refreshed
+        return refreshed
+
+    async def _get_fresh_credential(self, credential: UserCreds) -> UserCreds:
+        if _expires_in(credential.get("expires_at")) > ACCESS_TOKEN_REFRESH_MARGIN:
+            return credential
+        refresh_token = credential.get("refresh_token")
+        if not refresh_token:
+            return credential
+
+        refreshed = self._refreshed_creds.get(refresh_token)
+        if (
+            refreshed is not None
+            and _expires_in(refreshed.get("expires_at")) > ACCESS_TOKEN_REFRESH_MARGIN
+        ):
+            return refreshed
+
+        # 같은 유저의 동시 요청은 하나의 갱신 요청을 함께 기다림
+        task = self._refresh_inflight.get(refresh_token)
+        if task is None:
+            task = asyncio.create_task(self._refresh_credential(credential))
+            self._refresh_inflight[refresh_token] = task
+            task.add_done_callback(
+                lambda _: self._refresh_inflight.pop(refresh_token, None)
+            )
+        return await asyncio.shield(task)
+
+    async def _send_as_user(self, *requests, credential: UserCreds):
+        return await self._limiter.call(
+            self._google_client.as_user,
+            *requests,
+            user_creds=await self._get_fresh_credential(credential),
+        )
+
+    @retryable()
+    async def _as_user(self, *requests, credential: UserCreds):
+        # 조회 / 같은 값으로 덮어쓰는 요청용 (5xx 도 재시도)
+        return await self._send_as_user(*requests, credential=credential)
+
+    @retryable(status=RATE_LIMIT_STATUS_CODES)
+    async def _mutate_as_user(self, *requests, credential: UserCreds):
+        # 추가 / 삭제 / 복사처럼 두 번 적용되면 안 되는 요청용
+        # 5xx 는 이미 적용된 뒤일 수 있으므로 429 만 재시도
+        return await self._send_as_user(*requests, credential=credential)
+
+    async def _resolve_title_map(
+        self, spreadsheet_id: str, credential: UserCreds, refresh: bool = False
+    ) -> dict[str, int]:
+        title_map = self._sheet_id_cache.get(spreadsheet_id)
+        if title_map is None or refresh:
+            # 한 번의 조회로 스프레드시트의 모든 시트 ID 를 채움 (캐시는 조회 시 갱신됨)
+            meta = await self.fetch_spreadsheets_by_id(spreadsheet_id, credential)
+            title_map = meta.sheets_by_title
+        return title_map
+
+    async def _resolve_sheet_id(
+        self,
+        spreadsheet_id: str,
+        title: str,
+        credential: UserCreds,
+        refresh: bool = False,
+    ) -> int | None:
+        title_map = self._sheet_id_cache.get(spreadsheet_id)
+        if title_map is None or title not in title_map or refresh:
+            title_map = await self._resolve_title_map(
+                spreadsheet_id, credential, refresh=True
+            )
+        return title_map.get(title)
+
+    async def _cached_drive_list(
+        self, key: tuple[str, str, str], fetch
+    ) -> dict | list:
+        cached = self._drive_list_cache.get(key)
+        if cached is not None:
+            return cached
+        # 같은 유저의 동시 조회는 하나의 요청을 함께 기다림
+        task = self._drive_list_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._drive_list_inflight[key] = task
+
+            def _done(done: asyncio.Task) -> None:
+                if self._drive_list_inflight.get(key) is done:
+                    del self._drive_list_inflight[key]
+                    if not done.cancelled() and done.exception() is None:
+                        self._drive_list_cache[key] = done.result()
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    def _invalidate_drive_list(self, credential: UserCreds) -> None:
+        refresh_token = credential.get("refresh_token")
+        for key in [k for k in self._drive_list_cache if k[0] == refresh_token]:
+            self._drive_list_cache.pop(key, None)
+        for key in [k for k in self._drive_list_inflight if k[0] == refresh_token]:
+            self._drive_list_inflight.pop(key, None)
+
+    async def aclose(self) -> None:
+        await self._session.close()
+        await self._connector.close()
 
     def get_server_state(self) -> str:
         return self.__server_state
 
-    async def get_authorization_url(self) -> str:
+    @cached_property
+    def _authorization_url(self) -> str:
+        # client_id, redirect_uri, scopes, state 모두 프로세스 수명 동안 고정
         return self._google_client.oauth2.authorization_url(
             state=self.__server_state,
             access_type="offline",
@@ -53,10 +321,22 @@ class GoogleRequestService:
             prompt="consent",
         )
 
+    async def get_authorization_url(self) -> str:
+        return self._authorization_url
+
     async def fetch_user_credentials(self, code: str) -> dict:
-        return await self._google_client.oauth2.build_user_creds(
+        user_creds = await self._google_client.oauth2.build_user_creds(
             grant=code, client_creds=self.__google_credentials
         )
+        # 구글 응답은 여기서 한 번만 검증하고, 이후에는 검증 없이 GoogleCredential 을 생성
+        if not user_creds.get("access_token") or not user_creds.get("expires_at"):
+            raise APIError(
+                status_code=400,
+                error_code=ErrorCode.INVALID_GOOGLE_CODE,
+                message="구글 코드가 유효하지 않습니다.",
+            )
+        user_creds["expires_at"] = datetime.fromisoformat(user_creds["expires_at"])
+        return user_creds
 
     async def fetch_user_info(self, user_credentials: dict) -> dict:
         return await self._google_client.oauth2.get_me_info(
@@ -64,51 +344,135 @@ class GoogleRequestService:
         )
 
     @staticmethod
-    def build_user_credentials(google_credential: GoogleCredential) -> UserCreds:
+    @lru_cache(maxsize=1024)
+    def _build_user_creds_cached(
+        access_token: str, refresh_token: str, expires_at: datetime
+    ) -> UserCreds:
+        # 토큰이 바뀌면 키도 바뀌므로 별도 무효화 없이 오래된 항목은 LRU 로 밀려남
         return UserCreds(
-            access_token=google_credential.access_token,
-            refresh_token=google_credential.refresh_token,
-            expires_at=google_credential.access_token_expires_at,
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_at=expires_at,
+        )
+
+    @staticmethod
+    def build_user_credentials(google_credential: GoogleCredential) -> UserCreds:
+        return GoogleRequestService._build_user_creds_cached(
+            google_credential.access_token,
+            google_credential.refresh_token,
+            google_credential.access_token_expires_at,
         )
 
     async def fetch_drive_folder_id_by_name(
         self, folder_name: str, credential: UserCreds
     ) -> dict:
-        drive_v3 = await self._google_client.discover("drive", "v3")
-        query = f"name contains '{folder_name}' and mimeType='{GOOGLE_DRIVE_FOLDER_MIME_TYPE}' and trashed=false"
-        response = await self._google_client.as_user(
+        return await self._cached_drive_list(
+            (credential.get("refresh_token"), "folder", folder_name),
+            lambda: self._fetch_drive_folder_id_by_name(folder_name, credential),
+        )
+
+    async def fetch_drive_folder_id(
+        self, folder_name: str, credential: UserCreds
+    ) -> str:
+        key = (credential.get("refresh_token"), folder_name)
+        folder_id = self._folder_id_cache.get(key)
+        if folder_id is None:
+            folders = await self.fetch_drive_folder_id_by_name(folder_name, credential)
+            folder_id = self._folder_id_cache[key] = folders["files"][0]["id"]
+        return folder_id
+
+    async def _fetch_drive_folder_id_by_name(
+        self, folder_name: str, credential: UserCreds
+    ) -> dict:
+        drive_v3 = await self._drive()
+        response = await self._as_user(
             drive_v3.files.list(
-                q=query,
-                fields="files(id, name)",
+                q=_FOLDER_SEARCH_Q.format(name=_escape_query(folder_name)),
+                fields="files(id,name)",
                 orderBy="name",
+                prettyPrint="false",
             ),
-            user_creds=credential,
+            credential=credential,
         )
         return response
 
     async def create_drive_folder(
+        self, folder_name: str, credential: UserCreds, if_not_exists: bool = False
+    ) -> dict:
+        if not if_not_exists:
+            return await self._create_drive_folder(folder_name, credential)
+        key = (credential.get("refresh_token"), folder_name)
+        folder_id = self._folder_id_cache.get(key)
+        if folder_id is not None:
+            return {"id": folder_id}
+        # 같은 유저의 동시 요청이 폴더를 두 번 만들지 않도록 하나의 조회/생성을 함께 기다림
+        task = self._folder_ensure_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._ensure_drive_folder(folder_name, credential)
+            )
+            self._folder_ensure_inflight[key] = task
+            task.add_done_callback(
+                lambda _: self._folder_ensure_inflight.pop(key, None)
+            )
+        return await asyncio.shield(task)
+
+    async def _ensure_drive_folder(
+        self, folder_name: str, credential: UserCreds
+    ) -> dict:
+        drive_v3 = await self._drive()
+        # Drive 는 조건부 생성을 지원하지 않으므로 캐시에 없으면 조회 후 생성
+        existing = await self._as_user(
+            drive_v3.files.list(
+                q=_FOLDER_EXACT_Q.format(name=_escape_query(folder_name)),
+                fields="files(id)",
+                pageSize=1,
+            ),
+            credential=credential,
+        )
+        if existing.get("files"):
+            folder = existing["files"][0]
+        else:
+            folder = await self._create_drive_folder(folder_name, credential)
+        # 이어지는 fetch_drive_folder_id 는 Drive 조회 없이 캐시에서 바로 반환
+        key = (credential.get("refresh_token"), folder_name)
+        self._folder_id_cache[key] = folder["id"]
+        return folder
+
+    async def _create_drive_folder(
         self, folder_name: str, credential: UserCreds
     ) -> dict:
-        drive_v3 = await self._google_client.discover("drive", "v3")
-        response = await self._google_client.as_user(
+        drive_v3 = await self._drive()
+        response = await self._mutate_as_user(
             drive_v3.files.create(
                 json={"name": folder_name, "mimeType": GOOGLE_DRIVE_FOLDER_MIME_TYPE},
                 fields="id",
             ),
-            user_creds=credential,
+            credential=credential,
         )
+        self._invalidate_drive_list(credential)
         return response
 
     async def fetch_spreadsheets_in_folder(
         self, folder_name: str, credential: UserCreds
     ) -> list[dict]:
-        drive_v3 = await self._google_client.discover("drive", "v3")
-        folder_query = (
-            f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder'"
+        return await self._cached_drive_list(
+            (credential.get("refresh_token"), "spreadsheets", folder_name),
+            lambda: self._fetch_spreadsheets_in_folder(folder_name, credential),
         )
-        folder_response = await self._google_client.as_user(
-            drive_v3.files.list(q=folder_query, fields="files(id)"),
-            user_creds=credential,
+
+    async def _fetch_spreadsheets_in_folder(
+        self, folder_name: str, credential: UserCreds
+    ) -> list[dict]:
+        drive_v3 = await self._drive()
+        folder_response = await self._as_user(
+            drive_v3.files.list(
+                q=_FOLDER_EXACT_Q.format(name=_escape_query(folder_name)),
+                fields="files(id)",
+                pageSize=1,
+                prettyPrint="false",
+            ),
+            credential=credential,
         )
 
         if not folder_response.get("files"):
@@ -116,14 +480,14 @@ class GoogleRequestService:
 
         folder_id = folder_response["files"][0]["id"]
 
-        spreadsheet_query = f"'{folder_id}' in parents and mimeType='{GOOGLE_DRIVE_SPREADSHEET_MIME_TYPE}'"
-        spreadsheet_response = await self._google_client.as_user(
+        spreadsheet_response = await self._as_user(
             drive_v3.files.list(
-                q=spreadsheet_query,
-                fields="files(id, name, createdTime, modifiedTime)",
+                q=_SPREADSHEETS_IN_FOLDER_Q.format(folder_id=_escape_query(folder_id)),
+                fields="files(id,name)",
                 orderBy="modifiedTime desc",
+                prettyPrint="false",
             ),
-            user_creds=credential,
+            credential=credential,
         )
 
         return spreadsheet_response.get("files", [])
@@ -132,22 +496,26 @@ class GoogleRequestService:
         self, new_name: str, sheet_id: str, folder_id: str, credential: UserCreds
     ) -> dict:
         try:
-            drive_v3 = await self._google_client.discover("drive", "v3")
+            drive_v3 = await self._drive()
             file_metadata = {
                 "parents": [folder_id],
                 "name": f"[Mixir 팀빌딩] {new_name}",
             }
-            copy_response = await self._google_client.as_user(
+            copy_response = await self._mutate_as_user(
                 drive_v3.files.copy(
-                    fileId=sheet_id, json=file_metadata, fields="id,name"
+                    fileId=sheet_id, json=file_metadata, fields="id"
                 ),
-                user_creds=credential,
+                credential=credential,
             )
+            self._invalidate_drive_list(credential)
             return copy_response
         except Exception as e:
+            # 폴더가 삭제/이동된 경우 다음 요청에서 다시 조회하도록 캐시에서 제거
+            for key in [k for k, v in self._folder_id_cache.items() if v == folder_id]:
+                self._folder_id_cache.pop(key, None)
             if "insufficientPermissions" in str(e):
                 logger.error(
-                    "스프레드시트에 대한 접근 권한이 없습니다. 공유 설정을 확인해주세요.",
+                    "스프레드시트에 대한 접근 권한이 없습니다. 공유 설정을 확인해주세요: %s",
                     e,
                 )
             raise e
@@ -155,7 +523,7 @@ class GoogleRequestService:
     async def edit_drive_sheet_name(
         self, sheet_id: str, new_name: str, credential: UserCreds
     ) -> dict:
-        sheets_v4 = await self._google_client.discover("sheets", "v4")
+        sheets_v4 = await self._sheets()
         request_data = {
             "requests": [
                 {
@@ -166,25 +534,52 @@ class GoogleRequestService:
                 }
             ]
         }
-        response = await self._google_client.as_user(
+        response = await self._as_user(
             sheets_v4.spreadsheets.batchUpdate(
                 spreadsheetId=sheet_id, json=request_data
             ),
-            user_creds=credential,
+            credential=credential,
         )
+        self._invalidate_drive_list(credential)
         return response
 
     async def fetch_spreadsheets_by_id(
         self, sheet_id: str, credential: UserCreds
-    ) -> list[dict]:
-        sheets_v4 = await self._google_client.discover("sheets", "v4")
-        spreadsheet_info = await self._google_client.as_user(
+    ) -> SpreadsheetMeta:
+        sheets_v4 = await self._sheets()
+        spreadsheet_info = await self._as_user(
             sheets_v4.spreadsheets.get(
-                spreadsheetId=sheet_id, fields="sheets.properties"
+                spreadsheetId=sheet_id,
+                fields="sheets.properties(title,sheetId)",
+                prettyPrint="false",
             ),
-            user_creds=credential,
+            credential=credential,
         )
-        return spreadsheet_info
+        meta = SpreadsheetMeta.from_response(spreadsheet_info)
+        self._sheet_id_cache[sheet_id] = meta.sheets_by_title
+        return meta
+
+    async def fetch_spreadsheet_data_multi(
+        self,
+        sheet_id: str,
+        tab_names: list[str],
+        credential: UserCreds,
+    ) -> dict[str, dict]:
+        sheets_v4 = await self._sheets()
+        # 여러 시트를 한 번의 batchGet 으로 조회
+        ranges = [_student_range(tab_name) for tab_name in tab_names]
+        response = await self._as_user(
+            sheets_v4.spreadsheets.values.batchGet(
+                spreadsheetId=sheet_id,
+                ranges=ranges,
+                majorDimension="ROWS",
+                fields="valueRanges(values)",
+                prettyPrint="false",
+            ),
+            credential=credential,
+        )
+        # valueRanges 는 요청한 ranges 순서대로 반환됨
+        return dict(zip(tab_names, response.get("valueRanges", [])))
 
     async def fetch_spreadsheet_data(
         self,
@@ -192,35 +587,73 @@ class GoogleRequestService:
         tab_name: str,
         credential: UserCreds,
     ) -> dict:
-        sheets_v4 = await self._google_client.discover("sheets", "v4")
-        response = await self._google_client.as_user(
-            sheets_v4.spreadsheets.values.get(
-                spreadsheetId=sheet_id, range=f"'{tab_name}'", majorDimension="ROWS"
-            ),
-            user_creds=credential,
+        response = await self.fetch_spreadsheet_data_multi(
+            sheet_id, [tab_name], credential
         )
-        return response
+        return response[tab_name]
 
-    async def add_student(
+    async def fetch_spreadsheet_data_for_update(
         self,
         sheet_id: str,
         tab_name: str,
-        student_data: StudentSchema,
         credential: UserCreds,
     ) -> dict:
-        sheets_v4 = await self._google_client.discover("sheets", "v4")
-        response = await self._google_client.as_user(
+        """
+        시트 값과 sheetId 를 spreadsheets.get 한 번으로 조회
+
+        수정 전 조회에 사용하면 sheetId 캐시가 채워져서 이어지는 batchUpdate 전에
+        별도의 sheetId 조회가 필요 없음. 반환 형식은 fetch_spreadsheet_data 와 같음
+        """
+        sheets_v4 = await self._sheets()
+        response = await self._as_user(
             sheets_v4.spreadsheets.get(
-                spreadsheetId=sheet_id, fields="sheets.properties"
+                spreadsheetId=sheet_id,
+                ranges=[_student_range(tab_name)],
+                fields=(
+                    "sheets(properties(title,sheetId),"
+                    "data.rowData.values.formattedValue)"
+                ),
+                prettyPrint="false",
             ),
-            user_creds=credential,
+            credential=credential,
         )
+        sheets = response.get("sheets", [])
+        if not sheets:
+            return {}
+        properties = sheets[0]["properties"]
+        title_map = self._sheet_id_cache.setdefault(sheet_id, {})
+        title_map[properties["title"]] = properties["sheetId"]
 
-        worksheet_id = next(
-            sheet["properties"]["sheetId"]
-            for sheet in response["sheets"]
-            if sheet["properties"]["title"] == tab_name
-        )
+        # rowData 를 values API 와 같은 모양(문자열 리스트, 뒤쪽 빈 칸 제외)으로 변환
+        values = []
+        for grid in sheets[0].get("data", []):
+            for row in grid.get("rowData", []):
+                cells = [
+                    cell.get("formattedValue", "") for cell in row.get("values", [])
+                ]
+                while cells and cells[-1] == "":
+                    cells.pop()
+                values.append(cells)
+        while values and not values[-1]:
+            values.pop()
+        return {"values": values} if values else {}
+
+    async def add_student(
+        self,
+        sheet_id: str,
+        tab_name: str,
+        student_data: StudentSchema,
+        credential: UserCreds,
+    ) -> dict:
+        sheets_v4 = await self._sheets()
+        # 캐시 적중 시 appendCells 한 번으로 끝남 (서식 적용에는 sheetId 가 필요)
+        worksheet_id = await self._resolve_sheet_id(sheet_id, tab_name, credential)
+        if worksheet_id is None:
+            raise APIError(
+                status_code=404,
+                error_code=ErrorCode.SHEET_NOT_FOUND,
+                message="해당 시트를 찾을 수 없습니다.",
+            )
 
         request_data = {
             "requests": [
@@ -230,128 +663,64 @@ class GoogleRequestService:
                         "rows": [
                             {
                                 "values": [
-                                    {
-                                        "userEnteredValue": {
-                                            "stringValue": str(student_data.student_id)
-                                        },
-                                        "userEnteredFormat": {
-                                            "horizontalAlignment": "CENTER",
-                                            "verticalAlignment": "MIDDLE",
-                                        },
-                                    },
-                                    {
-                                        "userEnteredValue": {
-                                            "stringValue": student_data.name
-                                        },
-                                        "userEnteredFormat": {
-                                            "horizontalAlignment": "CENTER",
-                                            "verticalAlignment": "MIDDLE",
-                                        },
-                                    },
-                                    {
-                                        "userEnteredValue": {
-                                            "stringValue": {
-                                                "male": "남",
-                                                "female": "여",
-                                            }[student_data.gender]
-                                        },
-                                        "userEnteredFormat": {
-                                            "horizontalAlignment": "CENTER",
-                                            "verticalAlignment": "MIDDLE",
-                                        },
-                                    },
-                                    {
-                                        "userEnteredValue": {
-                                            "stringValue": student_data.level
-                                        },
-                                        "userEnteredFormat": {
-                                            "horizontalAlignment": "CENTER",
-                                            "verticalAlignment": "MIDDLE",
-                                        },
-                                    },
+                                    _cell(str(student_data.student_id)),
+                                    _cell(student_data.name),
+                                    _cell(_GENDER_KR[student_data.gender]),
+                                    _cell(student_data.level),
                                 ]
                             }
                         ],
-                        "fields": "userEnteredValue,userEnteredFormat(horizontalAlignment,verticalAlignment)",
+                        "fields": _CELL_FIELDS,
                     }
                 }
             ]
         }
-        response = await self._google_client.as_user(
-            sheets_v4.spreadsheets.batchUpdate(
-                spreadsheetId=sheet_id, json=request_data
-            ),
-            user_creds=credential,
-        )
+        try:
+            response = await self._mutate_as_user(
+                sheets_v4.spreadsheets.batchUpdate(
+                    spreadsheetId=sheet_id, json=request_data
+                ),
+                credential=credential,
+            )
+        except aiogoogle_excs.HTTPError:
+            # 시트가 이름 변경/삭제된 경우 다음 요청에서 sheetId 를 다시 조회
+            self._sheet_id_cache.pop(sheet_id, None)
+            raise
         return response
 
     async def create_group_sheet(
         self, sheet_id: str, name: str, credential: UserCreds
     ) -> dict:
-        sheets_v4 = await self._google_client.discover("sheets", "v4")
-        request_data = [{"addSheet": {"properties": {"title": name}}}]
-        response = await self._google_client.as_user(
-            sheets_v4.spreadsheets.batchUpdate(
-                spreadsheetId=sheet_id, json={"requests": request_data}
-            ),
-            user_creds=credential,
-        )
-        worksheet_id = response["replies"][0]["addSheet"]["properties"]["sheetId"]
+        sheets_v4 = await self._sheets()
+        # sheetId 를 직접 지정해서 시트 추가와 헤더 입력을 한 번의 batchUpdate 로 처리
+        worksheet_id = random.randrange(1, 2**31)
         request_data = {
             "requests": [
+                {
+                    "addSheet": {
+                        "properties": {"sheetId": worksheet_id, "title": name}
+                    }
+                },
                 {
                     "appendCells": {
                         "sheetId": worksheet_id,
-                        "rows": [
-                            {
-                                "values": [
-                                    {
-                                        "userEnteredValue": {"stringValue": "번호"},
-                                        "userEnteredFormat": {
-                                            "horizontalAlignment": "CENTER",
-                                            "verticalAlignment": "MIDDLE",
-                                        },
-                                    },
-                                    {
-                                        "userEnteredValue": {"stringValue": "이름"},
-                                        "userEnteredFormat": {
-                                            "horizontalAlignment": "CENTER",
-                                            "verticalAlignment": "MIDDLE",
-                                        },
-                                    },
-                                    {
-                                        "userEnteredValue": {"stringValue": "성별"},
-                                        "userEnteredFormat": {
-                                            "horizontalAlignment": "CENTER",
-                                            "verticalAlignment": "MIDDLE",
-                                        },
-                                    },
-                                    {
-                                        "userEnteredValue": {
-                                            "stringValue": "수준",
-                                        },
-                                        "userEnteredFormat": {
-                                            "horizontalAlignment": "CENTER",
-                                            "verticalAlignment": "MIDDLE",
-                                        },
-                                    },
-                                ]
-                            }
-                        ],
-                        "fields": "userEnteredValue,userEnteredFormat(horizontalAlignment,verticalAlignment)",
+                        "rows": [_GROUP_SHEET_HEADER_ROW],
+                        "fields": _CELL_FIELDS,
                     }
-                }
+                },
             ]
         }
-        last_response = await self._google_client.as_user(
+        response = await self._mutate_as_user(
             sheets_v4.spreadsheets.batchUpdate(
-                spreadsheetId=sheet_id,
-                json=request_data,  # worksheet_id에서 sheet_id로 수정
+                spreadsheetId=sheet_id, json=request_data
             ),
-            user_creds=credential,
+            credential=credential,
         )
+        sheet_ids = self._sheet_id_cache.get(sheet_id)
+        if sheet_ids is not None:
+            sheet_ids[name] = worksheet_id
 
-        return last_response
+        return response
     
     async def delete_group_sheet(
         self,
@@ -360,16 +729,12 @@ class GoogleRequestService:
         credential: dict,
     ) -> dict:
         """Delete a sheet from the spreadsheet"""
-        sheets_api = await self.build_sheets_api(credential)
+        sheets_v4 = await self._sheets()
         
-        # First get the sheet ID
-        spreadsheet = await self.fetch_spreadsheets_by_id(spreadsheet_id, credential)
-        sheet_id = None
-        for sheet in spreadsheet["sheets"]:
-            if sheet["properties"]["title"] == sheet_name:
-                sheet_id = sheet["properties"]["sheetId"]
-                break
-                
+        # 시트 삭제는 되돌릴 수 없으므로 캐시가 아닌 최신 sheetId 로 요청
+        sheet_id = await self._resolve_sheet_id(
+            spreadsheet_id, sheet_name, credential, refresh=True
+        )
         if sheet_id is None:
             raise APIError(
                 status_code=404,
@@ -387,10 +752,17 @@ class GoogleRequestService:
             ]
         }
         
-        response = await sheets_api.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            json=request_body
-        )
+        try:
+            response = await self._mutate_as_user(
+                sheets_v4.spreadsheets.batchUpdate(
+                    spreadsheetId=spreadsheet_id, json=request_body
+                ),
+                credential=credential,
+            )
+        except aiogoogle_excs.HTTPError:
+            self._sheet_id_cache.pop(spreadsheet_id, None)
+            raise
+        self._sheet_id_cache.get(spreadsheet_id, {}).pop(sheet_name, None)
         return response
     
     async def delete_student(
@@ -401,14 +773,21 @@ class GoogleRequestService:
         credential: dict,
     ) -> dict:
         """Delete a student row from the sheet"""
-        sheets_api = await self.build_sheets_api(credential)
+        sheets_v4 = await self._sheets()
+        sheet_id = await self._resolve_sheet_id(spreadsheet_id, sheet_name, credential)
+        if sheet_id is None:
+            raise APIError(
+                status_code=404,
+                error_code=ErrorCode.SHEET_NOT_FOUND,
+                message="해당 시트를 찾을 수 없습니다.",
+            )
         
         request_body = {
             "requests": [
                 {
                     "deleteDimension": {
                         "range": {
-                            "sheetId": await self._get_sheet_id(spreadsheet_id, sheet_name, credential),
+                            "sheetId": sheet_id,
                             "dimension": "ROWS",
                             "startIndex": row_index,
                             "endIndex": row_index + 1
@@ -418,10 +797,16 @@ class GoogleRequestService:
             ]
         }
         
-        response = await sheets_api.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            json=request_body
-        )
+        try:
+            response = await self._mutate_as_user(
+                sheets_v4.spreadsheets.batchUpdate(
+                    spreadsheetId=spreadsheet_id, json=request_body
+                ),
+                credential=credential,
+            )
+        except aiogoogle_excs.HTTPError:
+            self._sheet_id_cache.pop(spreadsheet_id, None)
+            raise
         return response
 
     
@@ -431,13 +816,15 @@ class GoogleRequestService:
         credential: dict,
     ) -> None:
         """스프레드시트(그룹) 삭제"""
-        drive_api = await self.build_drive_api(credential)
+        drive_v3 = await self._drive()
         
         try:
-            await drive_api.files.delete(
-                fileId=spreadsheet_id,
+            await self._mutate_as_user(
+                drive_v3.files.delete(fileId=spreadsheet_id),
+                credential=credential,
             )
-        except aiogoogle.excs.HTTPError as e:
+            self._invalidate_drive_list(credential)
+        except aiogoogle_excs.HTTPError as e:
             if e.res.status_code == 404:
                 raise APIError(
                     status_code=404,
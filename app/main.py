@@ -2,15 +2,19 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 
 from app.logger import use_logger
 from app.env_validator import get_settings
-from app.containers import AppContainers
+from app.containers import container
+from app.application.ratelimit import limiter
+from app.application.dependency_cache import patch_dependency_inspection
 
 from app.auth.endpoints import router as auth_router
-from app.application.test import router as test_router
 from app.student.endpoints import router as student_router
 from app.bracket.endpoints import router as bracket_router
 
@@ -23,7 +27,13 @@ def bootstrap() -> FastAPI:
     async def lifespan(application: FastAPI):
         logger.info("Starting application")
         motor_client = AsyncIOMotorClient(
-            settings.MONGODB_URI, uuidRepresentation="standard"
+            settings.MONGODB_URI,
+            uuidRepresentation="standard",
+            maxPoolSize=50,
+            minPoolSize=10,
+            maxIdleTimeMS=60000,
+            serverSelectionTimeoutMS=3000,
+            waitQueueTimeoutMS=2000,
         )
         await init_beanie(
             database=motor_client[settings.MONGODB_DATABASE],
@@ -33,48 +43,60 @@ def bootstrap() -> FastAPI:
                 "app.bracket.entities.Match",
             ],
         )
+        # 첫 인증 요청 전에 커넥션 풀을 미리 연결
+        await motor_client.admin.command("ping")
         application.container = container
         logger.info("Container Wiring started")
-        container.wire(
-            modules=[
-                __name__,
-                "app.auth.endpoints",
-                "app.student.endpoints",
-                "app.bracket.endpoints",
-            ]
-        )
+        # Provide[...] 를 사용하는 모듈만 wiring
+        container.wire(modules=["app.bracket.endpoints"])
         logger.info("Container Wiring complete")
+        # 첫 요청 전에 Google 커넥션 풀과 aiogoogle 클라이언트를 미리 생성
+        container.google.service()
+        patch_dependency_inspection()
+        # 시트 조회 요청을 모아서 처리하는 flush 루프
+        container.google.batcher().start()
         logger.info("Application started")
         yield
+        await container.google.batcher().aclose()
+        await container.google.service().aclose()
+        logger.info("Google API connections closed")
         motor_client.close()
         logger.info("Motor Client connections closed")
         logger.info("Application shutdown complete")
 
     origins = [
-        "mixir-api.sunrin.kr",
-        "mixir.sunrin.kr",
+        "https://mixir-api.sunrin.kr",
+        "https://mixir.sunrin.kr",
     ]
     app = FastAPI(
         title="Mixir Backend API",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/api/docs",
         redoc_url=None,
         debug=settings.APP_ENV == "development" or settings.APP_ENV == "testing",
     )
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        max_age=600,
     )
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
     return app
 
 
-container = AppContainers()
 server = bootstrap()
 
 server.include_router(auth_router)
-server.include_router(test_router)
 server.include_router(student_router)
 server.include_router(bracket_router)
+
+if settings.APP_ENV in ("development", "testing"):
+    # 테스트용 OAuth 콜백은 개발/테스트 환경에서만 노출
+    from app.application.test import router as test_router
+
+    server.include_router(test_router)
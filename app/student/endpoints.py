@@ -1,20 +1,20 @@
-import traceback
+from dataclasses import dataclass
 
 import aiogoogle.excs
-from dependency_injector.wiring import inject, Provide
+from aiogoogle.auth.creds import UserCreds
 
 from fastapi import APIRouter, Depends, Body
 from fastapi_restful.cbv import cbv
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.application.authorization import (
-    get_current_user_entity,
     get_current_auth_user_entity,
+    get_google_credential,
 )
 from app.application.error import ErrorCode
+from app.application.ratelimit import limiter
 from app.application.response import APIResponse, APIError, SuccessfulEntityResponse
-from app.containers import AppContainers
+from app.containers import get_google_batcher, get_google_service
+from app.google.batcher import GoogleRequestBatcher
 from app.google.services import GoogleRequestService
 from app.student.dto.add import AddStudentDTO
 from app.student.schema.group import (
@@ -32,34 +32,53 @@ from app.logger import use_logger
 settings = get_settings()
 logger = use_logger("student")
 
+_GENDER = {"남": "male", "여": "female"}
+
+
+def _row_index_map(values: list[list[str]]) -> dict[str, int]:
+    # 번호 -> 행 인덱스 (헤더 제외, 번호가 겹치면 위쪽 행 우선)
+    return {
+        row[0]: i
+        for i, row in reversed(list(enumerate(values[1:], start=1)))
+        if row
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class StudentContext:
+    user: User
+    google_service: GoogleRequestService
+    credential: UserCreds
+
+
+async def get_student_context(
+    user: User = Depends(get_current_auth_user_entity),
+    credential: UserCreds = Depends(get_google_credential),
+    google_service: GoogleRequestService = Depends(get_google_service),
+) -> StudentContext:
+    # 학생 엔드포인트가 공통으로 쓰는 의존성을 하나로 묶음
+    return StudentContext(
+        user=user, google_service=google_service, credential=credential
+    )
+
+
 router = APIRouter(
     prefix="/student",
     tags=["Student"],
     responses={404: {"description": "Not found"}},
 )
-limiter = Limiter(key_func=get_remote_address)
 
 
 @cbv(router)
 class StudentEndpoint:
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
     @router.get("/list", description="그룹 목록을 반환합니다.")
-    @inject
     async def get_group_list(
         self,
-        user: User = Depends(get_current_auth_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        ctx: StudentContext = Depends(get_student_context),
     ) -> APIResponse[GroupListSchema]:
 
-        google_credential = google_service.build_user_credentials(
-            user.google_credential
-        )
-        spreadsheet_list = await google_service.fetch_spreadsheets_in_folder(
-            "Mixir-팀빌딩", credential=google_credential
+        spreadsheet_list = await ctx.google_service.fetch_spreadsheets_in_folder(
+            "Mixir-팀빌딩", credential=ctx.credential
         )
         return APIResponse(
             message="그룹 목록 조회 완료",
@@ -75,27 +94,19 @@ class StudentEndpoint:
         )
 
     @router.post("/create", description="새 그룹 (파일) 만들기")
-    @inject
     async def create_new_group(
         self,
         name: str = Body(description="그룹 이름 (파일명)", embed=True),
-        user: User = Depends(get_current_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        ctx: StudentContext = Depends(get_student_context),
     ) -> APIResponse[SuccessfulEntityResponse]:
-        google_credential = google_service.build_user_credentials(
-            user.google_credential
+        folder_id = await ctx.google_service.fetch_drive_folder_id(
+            "Mixir-팀빌딩", credential=ctx.credential
         )
-        folders = await google_service.fetch_drive_folder_id_by_name(
-            "Mixir-팀빌딩", credential=google_credential
-        )
-        folder_id = folders["files"][0]["id"]
-        copy_response = await google_service.copy_drive_sheet(
+        copy_response = await ctx.google_service.copy_drive_sheet(
             sheet_id=settings.SHEET_TEMPLATE_ID,
             new_name=name,
             folder_id=folder_id,
-            credential=google_credential,
+            credential=ctx.credential,
         )
         return APIResponse(
             message="파일 생성 완료",
@@ -103,32 +114,24 @@ class StudentEndpoint:
         )
 
     @router.get("/{sheet_id}/groups", description="그룹 정보 조회")
-    @inject
     async def get_group_info(
         self,
         sheet_id: str,
-        user: User = Depends(get_current_auth_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        ctx: StudentContext = Depends(get_student_context),
     ) -> APIResponse[GroupListSchema]:
-        google_credential = google_service.build_user_credentials(
-            user.google_credential
-        )
         try:
-            spreadsheet_list = await google_service.fetch_spreadsheets_by_id(
-                sheet_id, credential=google_credential
+            spreadsheet_meta = await ctx.google_service.fetch_spreadsheets_by_id(
+                sheet_id, credential=ctx.credential
             )
             return APIResponse(
                 message="그룹 조회 완료",
                 data=GroupListSchema(
                     groups=[
-                        GroupSchema(
-                            group_id=str(group_data["properties"]["sheetId"]),
-                            name=group_data["properties"]["title"],
+                        GroupSchema(group_id=str(worksheet_id), name=title)
+                        for title, worksheet_id in (
+                            spreadsheet_meta.sheets_by_title.items()
                         )
-                        for group_data in spreadsheet_list["sheets"]
-                        if not group_data["properties"]["title"] == "Mixir 팀빌딩"
+                        if not title == "Mixir 팀빌딩"
                     ]
                 ),
             )
@@ -144,23 +147,15 @@ class StudentEndpoint:
         self,
         sheet_id: str,
         name: str = Body(description="팀 이름", embed=True),
-        user: User = Depends(get_current_auth_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        ctx: StudentContext = Depends(get_student_context),
     ) -> APIResponse[SuccessfulEntityResponse]:
         try:
-            google_credential = google_service.build_user_credentials(
-                user.google_credential
+            response = await ctx.google_service.edit_drive_sheet_name(
+                sheet_id, name, credential=ctx.credential
             )
-            response = await google_service.edit_drive_sheet_name(
-                sheet_id, name, credential=google_credential
-            )
-            logger.debug(f"edit_file_info response[id={sheet_id}]", response)
+            logger.debug("edit_file_info response[id=%s]: %s", sheet_id, response)
         except aiogoogle.excs.HTTPError:
-            logger.error(
-                f"[EDIT_FILE_INFO Error] user.id={user.id}", traceback.format_exc()
-            )
+            logger.exception("[EDIT_FILE_INFO Error] user.id=%s", ctx.user.id)
             raise APIError(
                 status_code=400,
                 error_code=ErrorCode.INVALID_SPREADSHEET_ID,
@@ -172,21 +167,14 @@ class StudentEndpoint:
         )
 
     @router.post("/{sheet_id}/groups", description="하위 그룹 만들기")
-    @inject
     async def create_group(
         self,
         sheet_id: str,
         name: str = Body(description="그룹 이름 (시트명)", embed=True),
-        user: User = Depends(get_current_auth_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        ctx: StudentContext = Depends(get_student_context),
     ) -> APIResponse[SuccessfulEntityResponse]:
-        google_credential = google_service.build_user_credentials(
-            user.google_credential
-        )
-        response = await google_service.create_group_sheet(
-            sheet_id, name, credential=google_credential
+        response = await ctx.google_service.create_group_sheet(
+            sheet_id, name, credential=ctx.credential
         )
         return APIResponse(
             message="그룹 생성 완료",
@@ -194,40 +182,29 @@ class StudentEndpoint:
         )
 
     @router.get("/{sheet_id}/{group_name}/members", description="그룹 멤버 조회")
-    @inject
     async def get_group_members(
         self,
         sheet_id: str,
         group_name: str,
-        user: User = Depends(get_current_auth_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        ctx: StudentContext = Depends(get_student_context),
+        google_batcher: GoogleRequestBatcher = Depends(get_google_batcher),
     ) -> APIResponse[StudentListSchema]:
-        google_credential = google_service.build_user_credentials(
-            user.google_credential
-        )
         try:
-            spreadsheet_data = await google_service.fetch_spreadsheet_data(
-                sheet_id, group_name, credential=google_credential
+            spreadsheet_data = await google_batcher.fetch_spreadsheet_data(
+                sheet_id, group_name, credential=ctx.credential
             )
-            student_list = []
-            for student_data in spreadsheet_data["values"][1:]:
-                student_model_kwargs = {
-                    "student_id": student_data[0],
-                    "name": student_data[1],
-                    "gender": {"남": "male", "여": "female"}[student_data[2]],
-                }
-                if len(student_data) > 3:
-                    student_model_kwargs["level"] = student_data[3]
-                else:
-                    student_model_kwargs["level"] = None
-                student_list.append(StudentSchema(**student_model_kwargs))
+            student_list = [
+                StudentSchema(
+                    student_id=row[0],
+                    name=row[1],
+                    gender=_GENDER[row[2]],
+                    level=row[3] if len(row) > 3 else None,
+                )
+                for row in spreadsheet_data.get("values", [])[1:]
+            ]
             return APIResponse(
                 message="그룹 조회 완료",
-                data=StudentListSchema(
-                    students=student_list,
-                ),
+                data=StudentListSchema(students=student_list),
             )
         except aiogoogle.excs.HTTPError:
             raise APIError(
@@ -237,30 +214,21 @@ class StudentEndpoint:
             )
 
     @router.delete("/{sheet_id}", description="그룹(스프레드시트) 삭제")
-    @inject
     async def delete_spreadsheet(
         self,
         sheet_id: str,
-        user: User = Depends(get_current_auth_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        ctx: StudentContext = Depends(get_student_context),
     ) -> APIResponse[SuccessfulEntityResponse]:
-        google_credential = google_service.build_user_credentials(
-            user.google_credential
-        )
         try:
-            await google_service.delete_spreadsheet(
-                sheet_id, credential=google_credential
+            await ctx.google_service.delete_spreadsheet(
+                sheet_id, credential=ctx.credential
             )
             return APIResponse(
                 message="그룹 삭제 완료",
                 data=SuccessfulEntityResponse(entity_id=sheet_id),
             )
         except aiogoogle.excs.HTTPError:
-            logger.error(
-                f"[DELETE_SPREADSHEET Error] user.id={user.id}", traceback.format_exc()
-            )
+            logger.exception("[DELETE_SPREADSHEET Error] user.id=%s", ctx.user.id)
             raise APIError(
                 status_code=400,
                 error_code=ErrorCode.INVALID_SPREADSHEET_ID,
@@ -268,31 +236,22 @@ class StudentEndpoint:
             )
 
     @router.delete("/{sheet_id}/{group_name}", description="하위 그룹 삭제")
-    @inject
     async def delete_group(
         self,
         sheet_id: str,
         group_name: str,
-        user: User = Depends(get_current_auth_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        ctx: StudentContext = Depends(get_student_context),
     ) -> APIResponse[SuccessfulEntityResponse]:
-        google_credential = google_service.build_user_credentials(
-            user.google_credential
-        )
         try:
-            response = await google_service.delete_group_sheet(
-                sheet_id, group_name, credential=google_credential
+            response = await ctx.google_service.delete_group_sheet(
+                sheet_id, group_name, credential=ctx.credential
             )
             return APIResponse(
                 message="그룹 삭제 완료",
                 data=SuccessfulEntityResponse(entity_id=sheet_id),
             )
         except aiogoogle.excs.HTTPError:
-            logger.error(
-                f"[DELETE_GROUP Error] user.id={user.id}", traceback.format_exc()
-            )
+            logger.exception("[DELETE_GROUP Error] user.id=%s", ctx.user.id)
             raise APIError(
                 status_code=400,
                 error_code=ErrorCode.INVALID_SPREADSHEET_ID,
@@ -300,32 +259,32 @@ class StudentEndpoint:
             )
 
     @router.delete("/{sheet_id}/{group_name}/members/{student_id}", description="그룹 멤버 삭제")
-    @inject
     async def delete_group_member(
         self,
         sheet_id: str,
         group_name: str,
         student_id: str,
-        user: User = Depends(get_current_auth_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        ctx: StudentContext = Depends(get_student_context),
     ) -> APIResponse[SuccessfulEntityResponse]:
-        google_credential = google_service.build_user_credentials(
-            user.google_credential
-        )
         try:
             # First fetch the current data to verify the student exists
-            spreadsheet_data = await google_service.fetch_spreadsheet_data(
-                sheet_id, group_name, credential=google_credential
+            spreadsheet_data = (
+                await ctx.google_service.fetch_spreadsheet_data_for_update(
+                    sheet_id, group_name, credential=ctx.credential
+                )
             )
             
             # Find the row index of the student to delete
+            # 번호는 추가 시 행 번호로 매겨지므로 먼저 해당 행을 확인하고, 삭제로
+            # 행이 밀린 경우에만 전체를 탐색
+            rows = spreadsheet_data.get("values", [])
             student_row = None
-            for i, row in enumerate(spreadsheet_data["values"][1:], start=1):
-                if row[0] == student_id:
-                    student_row = i
-                    break
+            if student_id.isdecimal():
+                guess = int(student_id)
+                if 0 < guess < len(rows) and rows[guess][:1] == [student_id]:
+                    student_row = guess
+            if student_row is None:
+                student_row = _row_index_map(rows).get(student_id)
                     
             if student_row is None:
                 raise APIError(
@@ -334,11 +293,11 @@ class StudentEndpoint:
                     message="해당 학생을 찾을 수 없습니다.",
                 )
                 
-            response = await google_service.delete_student(
+            response = await ctx.google_service.delete_student(
                 sheet_id,
                 group_name,
                 student_row,
-                credential=google_credential,
+                credential=ctx.credential,
             )
             
             return APIResponse(
@@ -346,9 +305,7 @@ class StudentEndpoint:
                 data=SuccessfulEntityResponse(entity_id=sheet_id),
             )
         except aiogoogle.excs.HTTPError:
-            logger.error(
-                f"[DELETE_MEMBER Error] user.id={user.id}", traceback.format_exc()
-            )
+            logger.exception("[DELETE_MEMBER Error] user.id=%s", ctx.user.id)
             raise APIError(
                 status_code=400,
                 error_code=ErrorCode.INVALID_SPREADSHEET_ID,
@@ -356,26 +313,21 @@ class StudentEndpoint:
             )
 
     @router.post("/{sheet_id}/{group_name}/members", description="그룹 멤버 추가")
-    @inject
     async def add_group_member(
         self,
         sheet_id: str,
         group_name: str,
         data: AddStudentDTO,
-        user: User = Depends(get_current_auth_user_entity),
-        google_service: GoogleRequestService = Depends(
-            Provide[AppContainers.google.service]
-        ),
+        ctx: StudentContext = Depends(get_student_context),
     ) -> APIResponse[SuccessfulEntityResponse]:
-        google_credential = google_service.build_user_credentials(
-            user.google_credential
-        )
         try:
-            spreadsheet_data = await google_service.fetch_spreadsheet_data(
-                sheet_id, group_name, credential=google_credential
+            spreadsheet_data = (
+                await ctx.google_service.fetch_spreadsheet_data_for_update(
+                    sheet_id, group_name, credential=ctx.credential
+                )
             )
-            next_student_id = len(spreadsheet_data["values"][1:]) + 1
-            response = await google_service.add_student(
+            next_student_id = len(spreadsheet_data.get("values", [])[1:]) + 1
+            response = await ctx.google_service.add_student(
                 sheet_id,
                 group_name,
                 StudentSchema(
@@ -384,14 +336,16 @@ class StudentEndpoint:
                     gender=data.gender,
                     level=data.level,
                 ),
-                credential=google_credential,
+                credential=ctx.credential,
             )
             return APIResponse(
                 message="그룹 조회 완료",
                 data=SuccessfulEntityResponse(entity_id=response["spreadsheetId"]),
             )
         except aiogoogle.excs.HTTPError:
-            logger.error(traceback.format_exc())
+            logger.exception(
+                "[ADD_MEMBER Error] user.id=%s sheet_id=%s", ctx.user.id, sheet_id
+            )
             raise APIError(
                 status_code=400,
                 error_code=ErrorCode.INVALID_SPREADSHEET_ID,
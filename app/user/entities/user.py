@@ -1,13 +1,17 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID, uuid4
 from beanie import Document, Indexed, Link
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.application.pydantic_model import BaseSchema
 from app.bracket.entities import Match
 
 
 class GoogleCredential(BaseSchema):
+    # 요청마다 읽기만 하므로 불변으로 둠 (갱신 시에는 새 객체로 교체)
+    model_config = ConfigDict(frozen=True)
+
     refresh_token: str = Field(..., description="구글 OAuth2 refresh token")
     access_token: str = Field(..., description="구글 OAuth2 access token")
     access_token_expires_at: datetime = Field(
@@ -18,10 +22,34 @@ class GoogleCredential(BaseSchema):
 
 class User(Document):
     id: UUID = Field(default_factory=uuid4, alias="_id")
-    name: Indexed(str) = Field(..., description="사용자 이름")
+    name: str = Field(..., description="사용자 이름")
     email: Indexed(str, unique=True) = Field(
         ..., description="사용자 이메일"
     )  # 이메일은 유니크해야 할 것 같아서 unique 인덱스 추가
-    picture: Indexed(str) = Field(..., description="사용자 프로필 사진")
+    picture: str = Field(..., description="사용자 프로필 사진")
     google_credential: GoogleCredential = Field(..., description="구글 OAuth2 정보")
     matches: list[Link[Match]] = Field([], description="매치 정보")
+
+
+class UserLoginView(BaseModel):
+    """로그인 시 필요한 필드만 가져오는 User projection"""
+
+    id: UUID = Field(..., alias="_id")
+    email: str = Field(..., description="사용자 이메일")
+    refresh_token_fallback: str | None = Field(
+        None, description="저장된 구글 OAuth2 refresh token"
+    )
+
+    class Settings:
+        # GoogleCredential 은 camelCase alias 로 저장됨
+        projection = {"_id": 1, "email": 1, "google_credential.refreshToken": 1}
+
+    @model_validator(mode="before")
+    @classmethod
+    def flatten_refresh_token(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "google_credential" in data:
+            data = dict(data)
+            data["refresh_token_fallback"] = data.pop("google_credential").get(
+                "refreshToken"
+            )
+        return data